@@ -3,9 +3,10 @@ Application Configuration
 
 Centralized configuration management using environment variables.
 """
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import Optional
-from pydantic_settings import BaseSettings
+from pydantic import computed_field
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -18,6 +19,10 @@ class Settings(BaseSettings):
         secret_key: Secret key for JWT tokens.
         mongodb_url: MongoDB connection URL.
         database_name: Name of the MongoDB database.
+        mongo_max_pool: Maximum connections in the MongoDB pool.
+        mongo_min_pool: Connections the MongoDB pool keeps open when idle.
+        mongo_max_idle_ms: Idle time before a pooled connection is recycled.
+        mongo_server_selection_timeout_ms: Time to wait for a usable server.
         access_token_expire_minutes: JWT token expiration time.
         cors_origins: Allowed CORS origins.
     """
@@ -34,6 +39,10 @@ class Settings(BaseSettings):
     # Database
     mongodb_url: str = "mongodb://localhost:27017"
     database_name: str = "taskmanager"
+    mongo_max_pool: int = 100
+    mongo_min_pool: int = 10
+    mongo_max_idle_ms: int = 1_800_000
+    mongo_server_selection_timeout_ms: int = 2000
 
     # CORS
     cors_origins: str = "*"
@@ -46,14 +55,17 @@ class Settings(BaseSettings):
     log_level: str = "INFO"
     log_format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        frozen=True,
+    )
 
-    @property
+    @computed_field
+    @cached_property
     def cors_origins_list(self) -> list:
-        """Get CORS origins as a list."""
+        """Get CORS origins as a list, parsed once per settings instance."""
         if self.cors_origins == "*":
             return ["*"]
         return [origin.strip() for origin in self.cors_origins.split(",")]
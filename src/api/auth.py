@@ -5,48 +5,66 @@ Handles user registration, login, and token management.
 """
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
+from pydantic import TypeAdapter
 
+from src.api.responses import json_response
 from src.models.user import User, UserCreate, UserLogin, Token
-from src.services.auth_service import AuthService, get_current_user
+from src.services.auth_service import (
+    AuthService,
+    get_auth_service,
+    get_current_user,
+    invalidate_token,
+    oauth2_scheme,
+)
 
 router = APIRouter()
 
+# Prebuilt serializers for response bodies
+_USER_ADAPTER = TypeAdapter(User)
+_TOKEN_ADAPTER = TypeAdapter(Token)
+
 
 @router.post("/register", response_model=User, status_code=201)
-async def register(user_data: UserCreate):
+async def register(
+    user_data: UserCreate,
+    service: AuthService = Depends(get_auth_service),
+):
     """
     Register a new user.
 
     Returns the created user (without password).
     Raises 400 if email or username already exists.
     """
-    service = AuthService()
-
     # Check for existing user
-    if await service.get_user_by_email(user_data.email):
+    existing = await service.find_existing(user_data.email, user_data.username)
+
+    if existing == "email":
         raise HTTPException(
             status_code=400,
             detail="Email already registered"
         )
 
-    if await service.get_user_by_username(user_data.username):
+    if existing == "username":
         raise HTTPException(
             status_code=400,
             detail="Username already taken"
         )
 
-    return await service.create_user(user_data)
+    user = await service.create_user(user_data)
+    return json_response(_USER_ADAPTER, user, status_code=201)
 
 
 @router.post("/login", response_model=Token)
-async def login(credentials: UserLogin):
+async def login(
+    credentials: UserLogin,
+    service: AuthService = Depends(get_auth_service),
+):
     """
     Authenticate user and return JWT token.
 
     Returns access token on success.
     Raises 401 if credentials are invalid.
     """
-    service = AuthService()
     user = await service.authenticate_user(
         email=credentials.email,
         password=credentials.password
@@ -65,19 +83,20 @@ async def login(credentials: UserLogin):
             detail="User account is disabled"
         )
 
-    return await service.create_access_token(user)
+    token = await service.create_access_token(user)
+    return json_response(_TOKEN_ADAPTER, token)
 
 
 @router.post("/token", response_model=Token)
 async def login_for_access_token(
-    form_data: OAuth2PasswordRequestForm = Depends()
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    service: AuthService = Depends(get_auth_service),
 ):
     """
     OAuth2 compatible token endpoint.
 
     Accepts form data for compatibility with OAuth2 clients.
     """
-    service = AuthService()
     user = await service.authenticate_user(
         email=form_data.username,  # OAuth2 uses 'username' field
         password=form_data.password
@@ -90,7 +109,8 @@ async def login_for_access_token(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    return await service.create_access_token(user)
+    token = await service.create_access_token(user)
+    return json_response(_TOKEN_ADAPTER, token)
 
 
 @router.get("/me", response_model=User)
@@ -100,17 +120,21 @@ async def get_current_user_info(
     """
     Get current authenticated user's information.
     """
-    return current_user
+    return json_response(_USER_ADAPTER, current_user)
 
 
 @router.post("/refresh", response_model=Token)
 async def refresh_token(
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    token: str = Depends(oauth2_scheme),
+    service: AuthService = Depends(get_auth_service),
 ):
     """
     Refresh the access token.
 
     Requires a valid (non-expired) token.
+    The old token is dropped from the authentication cache.
     """
-    service = AuthService()
-    return await service.create_access_token(current_user)
+    invalidate_token(token)
+    new_token = await service.create_access_token(current_user)
+    return json_response(_TOKEN_ADAPTER, new_token)
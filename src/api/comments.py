@@ -4,10 +4,14 @@ Task Comments API
 Provides endpoints for managing comments on tasks.
 Users can add, view, and delete comments on their tasks.
 """
+from collections import defaultdict
+from itertools import count
 from typing import List
-from datetime import datetime
+from datetime import datetime, timezone
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
+
+from src.api.responses import json_response, stream_json_array
 
 router = APIRouter()
 
@@ -27,9 +31,15 @@ class Comment(BaseModel):
     created_at: datetime
 
 
-# In-memory storage for comments
-_comments: dict[str, Comment] = {}
-_counter = 0
+# Prebuilt serializers for response bodies
+_COMMENT_ADAPTER = TypeAdapter(Comment)
+
+
+# In-memory storage for comments, grouped by task in creation order
+_comments_by_task: defaultdict[str, list[Comment]] = defaultdict(list)
+# Task ID of each comment, for lookups by comment ID
+_comment_task_ids: dict[str, str] = {}
+_comment_ids = count(1)
 
 
 @router.post("/", response_model=Comment, status_code=201)
@@ -47,17 +57,16 @@ async def create_comment(comment: CommentCreate, user_id: str = "demo_user"):
     Returns:
         The created comment with generated ID and timestamp
     """
-    global _counter
-    _counter += 1
     new_comment = Comment(
-        id=f"comment_{_counter}",
+        id=f"comment_{next(_comment_ids)}",
         task_id=comment.task_id,
         user_id=user_id,
         text=comment.text,
-        created_at=datetime.utcnow()
+        created_at=datetime.now(timezone.utc)
     )
-    _comments[new_comment.id] = new_comment
-    return new_comment
+    _comments_by_task[new_comment.task_id].append(new_comment)
+    _comment_task_ids[new_comment.id] = new_comment.task_id
+    return json_response(_COMMENT_ADAPTER, new_comment, status_code=201)
 
 
 @router.get("/task/{task_id}", response_model=List[Comment])
@@ -74,7 +83,11 @@ async def get_task_comments(task_id: str):
     Returns:
         List of comments for the specified task
     """
-    return [c for c in _comments.values() if c.task_id == task_id]
+    # Snapshot the list so a concurrent delete cannot shift it mid-stream
+    return stream_json_array(
+        _COMMENT_ADAPTER,
+        list(_comments_by_task.get(task_id, ()))
+    )
 
 
 @router.delete("/{comment_id}")
@@ -93,7 +106,11 @@ async def delete_comment(comment_id: str):
     Raises:
         HTTPException: 404 if comment not found
     """
-    if comment_id not in _comments:
+    if comment_id not in _comment_task_ids:
         raise HTTPException(status_code=404, detail="Comment not found")
-    del _comments[comment_id]
+    task_id = _comment_task_ids.pop(comment_id)
+    task_comments = _comments_by_task[task_id]
+    task_comments[:] = [c for c in task_comments if c.id != comment_id]
+    if not task_comments:
+        del _comments_by_task[task_id]
     return {"deleted": True}
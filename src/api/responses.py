@@ -0,0 +1,82 @@
+"""
+API Response Helpers
+
+Serializes response bodies with prebuilt pydantic TypeAdapters.
+"""
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Union
+
+from fastapi import Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+
+
+def json_response(
+    adapter: TypeAdapter,
+    obj: Any,
+    status_code: int = 200
+) -> Response:
+    """
+    Build a JSON response using a module-level TypeAdapter.
+
+    Handlers return this instead of relying on response_model, so FastAPI
+    skips its per-request field cloning and validation. The object is
+    validated against the adapter's type first, which accepts raw database
+    documents as well as model instances.
+
+    Args:
+        adapter: The TypeAdapter for the response type.
+        obj: The object to serialize.
+        status_code: The HTTP status code of the response.
+
+    Returns:
+        A response with the serialized JSON body.
+    """
+    return Response(
+        content=adapter.dump_json(adapter.validate_python(obj)),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def stream_json_array(
+    adapter: TypeAdapter,
+    items: Union[Iterable[Any], AsyncIterable[Any]],
+    status_code: int = 200
+) -> StreamingResponse:
+    """
+    Stream items as a JSON array, serializing one item at a time.
+
+    The body is written as items arrive, so a database cursor is never
+    materialized into a list and clients can start parsing early.
+
+    Args:
+        adapter: The TypeAdapter for a single item.
+        items: The items to serialize, synchronous or asynchronous.
+        status_code: The HTTP status code of the response.
+
+    Returns:
+        A streaming response with the JSON array body.
+    """
+    return StreamingResponse(
+        _iter_json_array(adapter, items),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+async def _iter_json_array(
+    adapter: TypeAdapter,
+    items: Union[Iterable[Any], AsyncIterable[Any]]
+) -> AsyncIterator[bytes]:
+    """Yield the framing and serialized items of a JSON array."""
+    yield b"["
+    separator = b""
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield separator + adapter.dump_json(adapter.validate_python(item))
+            separator = b","
+    else:
+        for item in items:
+            yield separator + adapter.dump_json(adapter.validate_python(item))
+            separator = b","
+    yield b"]"
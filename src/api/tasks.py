@@ -5,14 +5,23 @@ Provides CRUD endpoints for task management.
 """
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import TypeAdapter
 
+from src.api.responses import json_response, stream_json_array
 from src.models.task import Task, TaskCreate, TaskUpdate, TaskAssignment, Priority, TaskStatus
 from src.models.user import User
-from src.services.task_service import TaskService
-from src.services.auth_service import AuthService, get_current_user
+from src.services.task_service import TaskService, get_task_service
+from src.services.auth_service import (
+    credentials_exception,
+    get_current_user,
+    get_current_user_id,
+)
 
 router = APIRouter()
 
+# Prebuilt serializers for response bodies
+_TASK_ADAPTER = TypeAdapter(Task)
+
 
 @router.get("/", response_model=List[Task])
 async def list_tasks(
@@ -21,33 +30,35 @@ async def list_tasks(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     current_user: User = Depends(get_current_user),
+    service: TaskService = Depends(get_task_service),
 ):
     """
     List all tasks for the current user.
 
     Supports filtering by status and priority, with pagination.
+    Tasks are streamed to the client as they are read from the database.
     """
-    service = TaskService()
-    return await service.get_user_tasks(
+    tasks = service.iter_user_tasks(
         user_id=current_user.id,
         status=status,
         priority=priority,
         skip=skip,
         limit=limit,
     )
+    return stream_json_array(_TASK_ADAPTER, tasks)
 
 
 @router.get("/{task_id}", response_model=Task)
 async def get_task(
     task_id: int,
     current_user: User = Depends(get_current_user),
+    service: TaskService = Depends(get_task_service),
 ):
     """
     Get a specific task by ID.
 
     Returns 404 if the task doesn't exist or doesn't belong to the user.
     """
-    service = TaskService()
     task = await service.get_task(task_id)
 
     if not task:
@@ -56,21 +67,22 @@ async def get_task(
     if task.user_id != current_user.id and not current_user.is_admin:
         raise HTTPException(status_code=403, detail="Access denied")
 
-    return task
+    return json_response(_TASK_ADAPTER, task)
 
 
 @router.post("/", response_model=Task, status_code=201)
 async def create_task(
     task_data: TaskCreate,
     current_user: User = Depends(get_current_user),
+    service: TaskService = Depends(get_task_service),
 ):
     """
     Create a new task.
 
     The task will be assigned to the current user.
     """
-    service = TaskService()
-    return await service.create_task(task_data, user_id=current_user.id)
+    task = await service.create_task(task_data, user_id=current_user.id)
+    return json_response(_TASK_ADAPTER, task, status_code=201)
 
 
 @router.put("/{task_id}", response_model=Task)
@@ -78,13 +90,13 @@ async def update_task(
     task_id: int,
     task_data: TaskUpdate,
     current_user: User = Depends(get_current_user),
+    service: TaskService = Depends(get_task_service),
 ):
     """
     Update an existing task.
 
     Only the task owner or an admin can update a task.
     """
-    service = TaskService()
     task = await service.get_task(task_id)
 
     if not task:
@@ -93,20 +105,40 @@ async def update_task(
     if task.user_id != current_user.id and not current_user.is_admin:
         raise HTTPException(status_code=403, detail="Access denied")
 
-    return await service.update_task(task_id, task_data)
+    task = await service.update_task(task_id, task_data)
+    return json_response(_TASK_ADAPTER, task)
+
+
+@router.patch("/{task_id}", status_code=204)
+async def patch_task(
+    task_id: int,
+    task_data: TaskUpdate,
+    current_user: User = Depends(get_current_user),
+    service: TaskService = Depends(get_task_service),
+):
+    """
+    Update fields of an existing task without returning it.
+
+    Ownership is checked by the update itself, so the task is never read.
+    Returns 404 if the task doesn't exist or doesn't belong to the user;
+    admins can update any task.
+    """
+    owner_id = None if current_user.is_admin else current_user.id
+    if not await service.update_task_fields(task_id, task_data, user_id=owner_id):
+        raise HTTPException(status_code=404, detail="Task not found")
 
 
 @router.delete("/{task_id}", status_code=204)
 async def delete_task(
     task_id: int,
     current_user: User = Depends(get_current_user),
+    service: TaskService = Depends(get_task_service),
 ):
     """
     Delete a task.
 
     Only the task owner or an admin can delete a task.
     """
-    service = TaskService()
     task = await service.get_task(task_id)
 
     if not task:
@@ -122,13 +154,13 @@ async def delete_task(
 async def complete_task(
     task_id: int,
     current_user: User = Depends(get_current_user),
+    service: TaskService = Depends(get_task_service),
 ):
     """
     Mark a task as completed.
 
     Shortcut endpoint to quickly complete a task.
     """
-    service = TaskService()
     task = await service.get_task(task_id)
 
     if not task:
@@ -137,10 +169,11 @@ async def complete_task(
     if task.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="Access denied")
 
-    return await service.update_task(
+    task = await service.update_task(
         task_id,
         TaskUpdate(status=TaskStatus.COMPLETED)
     )
+    return json_response(_TASK_ADAPTER, task)
 
 
 @router.post("/{task_id}/duplicate", response_model=Task, status_code=201)
@@ -148,6 +181,7 @@ async def duplicate_task(
     task_id: int,
     new_title: Optional[str] = None,
     current_user: User = Depends(get_current_user),
+    service: TaskService = Depends(get_task_service),
 ):
     """
     Duplicate an existing task.
@@ -156,7 +190,6 @@ async def duplicate_task(
     The duplicate is assigned to the current user.
     Optionally provide a new title for the duplicate.
     """
-    service = TaskService()
     task = await service.duplicate_task(
         task_id=task_id,
         user_id=current_user.id,
@@ -166,14 +199,15 @@ async def duplicate_task(
     if not task:
         raise HTTPException(status_code=404, detail="Source task not found")
 
-    return task
+    return json_response(_TASK_ADAPTER, task, status_code=201)
 
 
 @router.post("/{task_id}/assign", response_model=Task)
 async def assign_task(
     task_id: int,
     assignment: TaskAssignment,
-    current_user: User = Depends(get_current_user),
+    current_user_id: int = Depends(get_current_user_id),
+    service: TaskService = Depends(get_task_service),
 ):
     """
     Assign a task to another user.
@@ -181,25 +215,29 @@ async def assign_task(
     Only the task owner or an admin can assign tasks.
     The target user must exist in the system.
     """
-    task_service = TaskService()
-    auth_service = AuthService()
-
-    # Get the task
-    task = await task_service.get_task(task_id)
+    # Get the task, the current user and the target user in one round trip
+    task, users = await service.get_task_with_users(
+        task_id,
+        [current_user_id, assignment.assigned_to]
+    )
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
 
+    current_user = users.get(current_user_id)
+    if not current_user:
+        raise credentials_exception()
+
     # Check permissions
     if task.user_id != current_user.id and not current_user.is_admin:
         raise HTTPException(status_code=403, detail="Access denied")
 
     # Verify target user exists
-    target_user = await auth_service.get_user_by_id(assignment.assigned_to)
-    if not target_user:
+    if assignment.assigned_to not in users:
         raise HTTPException(status_code=404, detail="Target user not found")
 
     # Update the task assignment
-    return await task_service.update_task(
+    task = await service.update_task(
         task_id,
         TaskUpdate(assigned_to=assignment.assigned_to)
     )
+    return json_response(_TASK_ADAPTER, task)
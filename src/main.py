@@ -4,18 +4,30 @@ Task Manager API - Main Application Entry Point
 This module initializes the FastAPI application and configures
 all routes, middleware, and dependencies.
 """
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from config.settings import get_settings
 from src.api.tasks import router as tasks_router
 from src.api.auth import router as auth_router
 from src.api.comments import router as comments_router
 from src.services.database import init_db
+from src.services.notification_service import notification_service
+
+settings = get_settings()
+
+# OpenAPI schema and interactive docs are only served in development
+_docs_enabled = settings.environment == "development"
 
 app = FastAPI(
     title="Task Manager API",
     description="A simple task management REST API",
     version="1.0.0",
+    openapi_url="/openapi.json" if _docs_enabled else None,
+    docs_url="/docs" if _docs_enabled else None,
+    redoc_url="/redoc" if _docs_enabled else None,
 )
 
 # CORS configuration
@@ -39,6 +51,12 @@ async def startup_event():
     await init_db()
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Finish queued notification deliveries on application shutdown."""
+    await asyncio.to_thread(notification_service.close)
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint for monitoring."""
@@ -52,6 +52,7 @@ class Token(BaseModel):
 
 class TokenPayload(BaseModel):
     """JWT token payload."""
-    sub: int  # user_id
-    exp: datetime
-    iat: datetime
+    sub: str  # user_id, a string as RFC 7519 requires
+    exp: int  # expiry, seconds since the epoch
+    iat: int  # issued at, seconds since the epoch
+    jti: str  # unique token ID
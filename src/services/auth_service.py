@@ -3,27 +3,117 @@ Authentication Service
 
 Handles user authentication, JWT token management, and password hashing.
 """
-from datetime import datetime, timedelta
-from typing import Optional
-
-from fastapi import Depends, HTTPException, status
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Literal, Optional
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import time
+
+from cachetools import TTLCache
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from passlib.context import CryptContext
 
 from src.models.user import User, UserCreate, UserInDB, Token, TokenPayload
-from src.services.database import get_db
+from src.services.database import get_db, reserve_id, utc_now
 
 # Configuration
 SECRET_KEY = "your-secret-key-here"  # In production, use environment variable
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
+ACCESS_TOKEN_EXPIRE = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+
+# Authentication caches
+AUTH_CACHE_SIZE = 10_000
+AUTH_CACHE_TTL = 60  # seconds
+
+# Maximum password hashes computed concurrently in worker threads
+PASSWORD_HASH_CONCURRENCY = (os.cpu_count() or 1) * 2
+
+# Number of user IDs reserved from the counter per database round trip
+USER_ID_BLOCK_SIZE = 100
+
+
+@lru_cache()
+def _pwd_context():
+    """
+    Get the password hashing context.
+
+    passlib and the bcrypt backend are imported on first use so that
+    importing this module stays cheap.
+    """
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+def _b64url(data: bytes) -> bytes:
+    """Base64url-encode without padding, as JWS requires."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# Static parts of every issued token, computed once
+_JWT_KEY = SECRET_KEY.encode()
+_JWT_HEADER = _b64url(
+    json.dumps({"alg": ALGORITHM, "typ": "JWT"}, separators=(",", ":")).encode()
+)
+
+# Fields returned for users read without their password hash
+USER_PROJECTION = {"_id": 0, "hashed_password": 0}
+
+
+class BearerTokenScheme(OAuth2PasswordBearer):
+    """
+    OAuth2 password bearer scheme with a direct header fast path.
+
+    FastAPI still derives the OpenAPI security metadata from the scheme,
+    but each request only slices the Authorization header instead of
+    going through the generic scheme/param parsing.
+    """
+
+    async def __call__(self, request: Request) -> Optional[str]:
+        authorization = request.headers.get("authorization", "")
+        if authorization[:7].lower() == "bearer ":
+            return authorization[7:]
+        if self.auto_error:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Not authenticated",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        return None
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 # OAuth2 scheme
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/token")
+oauth2_scheme = BearerTokenScheme(
+    tokenUrl="/api/auth/token",
+    scheme_name="OAuth2PasswordBearer",
+)
+
+# Decoded tokens, keyed by token digest: (user_id, exp timestamp)
+_token_cache: TTLCache = TTLCache(maxsize=AUTH_CACHE_SIZE, ttl=AUTH_CACHE_TTL)
+
+# Users resolved from tokens, keyed by user ID
+_user_cache: TTLCache = TTLCache(maxsize=AUTH_CACHE_SIZE, ttl=AUTH_CACHE_TTL)
+
+
+# Bounds bcrypt work so it cannot saturate the default thread pool
+_hash_semaphore = asyncio.Semaphore(PASSWORD_HASH_CONCURRENCY)
+
+
+def _token_cache_key(token: str) -> bytes:
+    """Digest a raw token so the cache never holds the token itself."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def invalidate_token(token: str) -> None:
+    """Remove a token from the decoded-token cache."""
+    _token_cache.pop(_token_cache_key(token), None)
 
 
 class AuthService:
@@ -31,57 +121,131 @@ class AuthService:
     Service class for authentication operations.
 
     Manages user registration, authentication, and JWT tokens.
+
+    User documents are only ever written from validated UserInDB models,
+    so users read back from the database are built with model_construct
+    and skip re-validation.
     """
 
-    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
-        """Verify a password against its hash."""
-        return pwd_context.verify(plain_password, hashed_password)
+    async def verify_password(
+        self,
+        plain_password: str,
+        hashed_password: str
+    ) -> bool:
+        """
+        Verify a password against its hash.
 
-    def hash_password(self, password: str) -> str:
-        """Hash a password for storage."""
-        return pwd_context.hash(password)
+        bcrypt runs in a worker thread so it does not block the event loop.
+        """
+        async with _hash_semaphore:
+            return await asyncio.to_thread(
+                _pwd_context().verify, plain_password, hashed_password
+            )
 
-    async def get_user_by_email(self, email: str) -> Optional[UserInDB]:
+    async def hash_password(self, password: str) -> str:
+        """
+        Hash a password for storage.
+
+        bcrypt runs in a worker thread so it does not block the event loop.
+        """
+        async with _hash_semaphore:
+            return await asyncio.to_thread(_pwd_context().hash, password)
+
+    async def get_user_by_email(
+        self,
+        email: str,
+        projection: Optional[dict] = None
+    ) -> Optional[UserInDB]:
         """
         Find a user by their email address.
 
         Args:
             email: The email to search for.
+            projection: Fields to fetch. Defaults to the full document.
 
         Returns:
             The user if found, None otherwise.
         """
         db = await get_db()
-        user_data = await db.users.find_one({"email": email})
-        return UserInDB(**user_data) if user_data else None
+        user_data = await db.users.find_one({"email": email}, projection=projection)
+        return UserInDB.model_construct(**user_data) if user_data else None
 
-    async def get_user_by_username(self, username: str) -> Optional[User]:
+    async def get_user_by_username(
+        self,
+        username: str,
+        projection: Optional[dict] = None
+    ) -> Optional[User]:
         """
         Find a user by their username.
 
         Args:
             username: The username to search for.
+            projection: Fields to fetch. Defaults to USER_PROJECTION.
 
         Returns:
             The user if found, None otherwise.
         """
         db = await get_db()
-        user_data = await db.users.find_one({"username": username})
-        return User(**user_data) if user_data else None
+        user_data = await db.users.find_one(
+            {"username": username},
+            projection=projection or USER_PROJECTION
+        )
+        return User.model_construct(**user_data) if user_data else None
 
-    async def get_user_by_id(self, user_id: int) -> Optional[User]:
+    async def get_user_by_id(
+        self,
+        user_id: int,
+        projection: Optional[dict] = None
+    ) -> Optional[User]:
         """
         Find a user by their ID.
 
         Args:
             user_id: The user's unique identifier.
+            projection: Fields to fetch. Defaults to USER_PROJECTION.
 
         Returns:
             The user if found, None otherwise.
         """
         db = await get_db()
-        user_data = await db.users.find_one({"id": user_id})
-        return User(**user_data) if user_data else None
+        user_data = await db.users.find_one(
+            {"id": user_id},
+            projection=projection or USER_PROJECTION
+        )
+        return User.model_construct(**user_data) if user_data else None
+
+    async def find_existing(
+        self,
+        email: str,
+        username: str
+    ) -> Optional[Literal["email", "username"]]:
+        """
+        Check whether an email or username is already registered.
+
+        Both fields are checked with a single query.
+
+        Args:
+            email: The email to look for.
+            username: The username to look for.
+
+        Returns:
+            "email" or "username" for the field that is taken (email wins
+            if both are), or None if neither is.
+        """
+        db = await get_db()
+
+        # Email and username are unique, so at most two users can match:
+        # one owning the email and another owning the username
+        existing = await db.users.find(
+            {"$or": [{"email": email}, {"username": username}]},
+            projection={"_id": 0, "email": 1, "username": 1}
+        ).to_list(length=2)
+
+        if not existing:
+            return None
+        if any(user["email"] == email for user in existing):
+            return "email"
+        return "username"
 
     async def create_user(self, user_data: UserCreate) -> User:
         """
@@ -95,13 +259,13 @@ class AuthService:
         """
         db = await get_db()
 
-        now = datetime.utcnow()
+        now = utc_now()
         user = UserInDB(
             id=await self._get_next_id(db),
             email=user_data.email,
             username=user_data.username,
             full_name=user_data.full_name,
-            hashed_password=self.hash_password(user_data.password),
+            hashed_password=await self.hash_password(user_data.password),
             is_active=True,
             is_admin=False,
             created_at=now,
@@ -111,7 +275,7 @@ class AuthService:
         await db.users.insert_one(user.model_dump())
 
         # Return user without hashed password
-        return User(**user.model_dump(exclude={"hashed_password"}))
+        return User.model_construct(**user.model_dump(exclude={"hashed_password"}))
 
     async def authenticate_user(
         self,
@@ -128,22 +292,29 @@ class AuthService:
         Returns:
             The user if authentication succeeds, None otherwise.
         """
-        user = await self.get_user_by_email(email)
+        db = await get_db()
+
+        # Fetch only what the password check needs
+        credentials = await db.users.find_one(
+            {"email": email},
+            projection={"_id": 0, "id": 1, "hashed_password": 1}
+        )
 
-        if not user:
+        if not credentials:
             return None
 
-        if not self.verify_password(password, user.hashed_password):
+        if not await self.verify_password(password, credentials["hashed_password"]):
             return None
 
-        # Update last login
-        db = await get_db()
-        await db.users.update_one(
-            {"id": user.id},
-            {"$set": {"last_login": datetime.utcnow()}}
+        # Update last login and read the user back in the same round trip
+        user_data = await db.users.find_one_and_update(
+            {"id": credentials["id"]},
+            {"$set": {"last_login": utc_now()}},
+            projection=USER_PROJECTION,
+            return_document=True
         )
 
-        return User(**user.model_dump(exclude={"hashed_password"}))
+        return User.model_construct(**user_data) if user_data else None
 
     async def create_access_token(self, user: User) -> Token:
         """
@@ -155,20 +326,23 @@ class AuthService:
         Returns:
             Token object with access_token and metadata.
         """
-        now = datetime.utcnow()
-        expire = now + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+        now = datetime.now(timezone.utc)
+        expire = now + ACCESS_TOKEN_EXPIRE
 
+        # "jti" makes every token unique, even when issued within the
+        # same second
         payload = TokenPayload(
-            sub=user.id,
-            exp=expire,
-            iat=now,
+            sub=str(user.id),
+            exp=int(expire.timestamp()),
+            iat=int(now.timestamp()),
+            jti=secrets.token_urlsafe(16),
         )
 
-        token = jwt.encode(
-            payload.model_dump(),
-            SECRET_KEY,
-            algorithm=ALGORITHM
+        signing_input = _JWT_HEADER + b"." + _b64url(
+            payload.model_dump_json().encode()
         )
+        signature = hmac.new(_JWT_KEY, signing_input, hashlib.sha256).digest()
+        token = (signing_input + b"." + _b64url(signature)).decode()
 
         return Token(
             access_token=token,
@@ -178,46 +352,92 @@ class AuthService:
 
     async def _get_next_id(self, db) -> int:
         """Generate the next auto-increment ID for users."""
-        result = await db.counters.find_one_and_update(
-            {"_id": "users"},
-            {"$inc": {"seq": 1}},
-            upsert=True,
-            return_document=True
-        )
-        return result["seq"]
+        return await reserve_id(db, "users", USER_ID_BLOCK_SIZE)
+
+
+# Singleton instance
+_auth_service = AuthService()
 
 
-async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
+def get_auth_service() -> AuthService:
     """
-    Dependency to get the current authenticated user from JWT token.
+    Dependency returning the shared AuthService.
+
+    AuthService holds no per-request state, so one instance serves all
+    requests.
+    """
+    return _auth_service
+
+
+def credentials_exception() -> HTTPException:
+    """Build the 401 error raised for missing or invalid credentials."""
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+async def get_current_user_id(token: str = Depends(oauth2_scheme)) -> int:
+    """
+    Dependency to get the current user's ID from JWT token.
+
+    Only verifies the token; it does not load the user. Handlers that
+    fetch the user together with other data can depend on this instead
+    of get_current_user.
 
     Args:
         token: The JWT token from the Authorization header.
 
     Returns:
-        The authenticated user.
+        The authenticated user's ID.
 
     Raises:
-        HTTPException: If token is invalid or user not found.
+        HTTPException: If token is invalid.
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+    # Cache hits skip signature verification until the token expires
+    key = _token_cache_key(token)
+    cached = _token_cache.get(key)
+    if cached and cached[1] > time.time():
+        return cached[0]
+
+    from jose import JWTError, jwt
 
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: int = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-    except JWTError:
-        raise credentials_exception
+        subject = payload.get("sub")
+        if subject is None:
+            raise credentials_exception()
+        user_id: int = int(subject)
+    except (JWTError, ValueError):
+        raise credentials_exception()
+
+    _token_cache[key] = (user_id, payload["exp"])
+    return user_id
 
-    service = AuthService()
-    user = await service.get_user_by_id(user_id)
 
+async def get_current_user(
+    user_id: int = Depends(get_current_user_id)
+) -> User:
+    """
+    Dependency to get the current authenticated user from JWT token.
+
+    Args:
+        user_id: The user ID from the verified token.
+
+    Returns:
+        The authenticated user.
+
+    Raises:
+        HTTPException: If token is invalid or user not found.
+    """
+    user = _user_cache.get(user_id)
     if user is None:
-        raise credentials_exception
+        user = await _auth_service.get_user_by_id(user_id)
+
+        if user is None:
+            raise credentials_exception()
+
+        _user_cache[user_id] = user
 
     return user
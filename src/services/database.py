@@ -3,17 +3,22 @@ Database Service
 
 MongoDB connection and database initialization.
 """
+from collections import defaultdict, deque
+from datetime import datetime, timezone
 from motor.motor_asyncio import AsyncIOMotorClient
 from typing import Optional
+import asyncio
 
-# Database configuration
-MONGODB_URL = "mongodb://localhost:27017"
-DATABASE_NAME = "taskmanager"
+from config.settings import get_settings
 
 # Global database client
 _client: Optional[AsyncIOMotorClient] = None
 _database = None
 
+# Reserved IDs not yet handed out, per counter
+_id_pools: defaultdict[str, deque] = defaultdict(deque)
+_id_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
 
 async def connect_db():
     """
@@ -23,12 +28,37 @@ async def connect_db():
     """
     global _client, _database
 
-    _client = AsyncIOMotorClient(MONGODB_URL)
-    _database = _client[DATABASE_NAME]
+    settings = get_settings()
+    _client = AsyncIOMotorClient(
+        settings.mongodb_url,
+        maxPoolSize=settings.mongo_max_pool,
+        minPoolSize=settings.mongo_min_pool,
+        maxIdleTimeMS=settings.mongo_max_idle_ms,
+        serverSelectionTimeoutMS=settings.mongo_server_selection_timeout_ms,
+        retryWrites=True,
+        # Read dates back as aware UTC, matching what the services write
+        tz_aware=True,
+        tzinfo=timezone.utc,
+    )
+    _database = _client[settings.database_name]
 
     # Verify connection
     await _client.admin.command("ping")
-    print(f"Connected to MongoDB: {DATABASE_NAME}")
+    print(f"Connected to MongoDB: {settings.database_name}")
+
+
+def utc_now() -> datetime:
+    """
+    Get the current UTC time at the precision MongoDB stores.
+
+    BSON dates keep milliseconds, so a timestamp returned right after a
+    write equals the one read back later.
+
+    Returns:
+        The current time as an aware UTC datetime.
+    """
+    now = datetime.now(timezone.utc)
+    return now.replace(microsecond=now.microsecond // 1000 * 1000)
 
 
 async def close_db():
@@ -59,6 +89,36 @@ async def get_db():
     return _database
 
 
+async def reserve_id(db, counter_name: str, block_size: int) -> int:
+    """
+    Get the next auto-increment ID from a named counter.
+
+    IDs are reserved from the counters collection in blocks of block_size
+    and served from an in-process pool, one per counter. IDs left in a
+    pool when the process exits are never used.
+
+    Args:
+        db: The database instance.
+        counter_name: The counter document's _id, e.g. "users" or "tasks".
+        block_size: Number of IDs to reserve per database round trip.
+
+    Returns:
+        The next unused ID.
+    """
+    pool = _id_pools[counter_name]
+    async with _id_locks[counter_name]:
+        if not pool:
+            result = await db.counters.find_one_and_update(
+                {"_id": counter_name},
+                {"$inc": {"seq": block_size}},
+                upsert=True,
+                return_document=True
+            )
+            last_id = result["seq"]
+            pool.extend(range(last_id - block_size + 1, last_id + 1))
+        return pool.popleft()
+
+
 async def init_db():
     """
     Initialize database with required collections and indexes.
@@ -76,9 +136,15 @@ async def init_db():
     # Create indexes for tasks collection
     await db.tasks.create_index("id", unique=True)
     await db.tasks.create_index("user_id")
-    await db.tasks.create_index([("user_id", 1), ("status", 1)])
+    # Equality fields before the due_date range; also serves status-only filters
+    await db.tasks.create_index([("user_id", 1), ("status", 1), ("due_date", 1)])
+    await db.tasks.create_index([("user_id", 1), ("priority", 1)])
     await db.tasks.create_index([("user_id", 1), ("due_date", 1)])
 
+    # Create indexes for comments collection
+    await db.comments.create_index("id", unique=True)
+    await db.comments.create_index([("task_id", 1), ("created_at", 1)])
+
     print("Database indexes created")
 
 
@@ -5,10 +5,19 @@ This module provides functionality for sending notifications through
 various channels including email, push notifications, and in-app messages.
 """
 
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
 from typing import Optional
 from dataclasses import dataclass
+import threading
+
+# Default number of threads delivering notifications
+DEFAULT_DELIVERY_WORKERS = 100
+
+# Deliveries allowed to wait for a free thread, per worker
+DELIVERY_QUEUE_FACTOR = 4
 
 
 class NotificationType(Enum):
@@ -27,6 +36,13 @@ class NotificationPriority(Enum):
     URGENT = "urgent"
 
 
+# Preference key controlling each notification channel
+_TYPE_PREF_KEY = {
+    notification_type: f"{notification_type.value}_enabled"
+    for notification_type in NotificationType
+}
+
+
 @dataclass
 class Notification:
     """Represents a notification to be sent to a user."""
@@ -45,17 +61,56 @@ class Notification:
             self.created_at = datetime.utcnow()
 
 
+@dataclass
+class NotificationRequest:
+    """A notification to create as part of a bulk send."""
+    user_id: str
+    title: str
+    message: str
+    notification_type: NotificationType = NotificationType.IN_APP
+    priority: NotificationPriority = NotificationPriority.NORMAL
+
+
 class NotificationService:
     """
     Service for managing and sending notifications to users.
 
     Supports multiple notification channels and priority levels.
     Handles notification queuing, delivery tracking, and user preferences.
+
+    Single notifications are delivered on a bounded thread pool, so
+    callers do not wait on the channel. When too many deliveries are
+    queued, send_notification blocks until one finishes.
     """
 
-    def __init__(self):
-        """Initialize the notification service."""
+    def __init__(self, max_workers: int = DEFAULT_DELIVERY_WORKERS):
+        """
+        Initialize the notification service.
+
+        Args:
+            max_workers: Maximum number of concurrent deliveries
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="notif",
+        )
+        self._delivery_slots = threading.Semaphore(max_workers * DELIVERY_QUEUE_FACTOR)
+        # Futures of deliveries still running or queued, by notification ID
+        self._deliveries: dict[str, Future] = {}
+        # Channel senders; IN_APP has none and is always available
+        self._senders = {
+            NotificationType.EMAIL: self._send_email,
+            NotificationType.PUSH: self._send_push,
+            NotificationType.SMS: self._send_sms,
+        }
+        self._batch_senders = {
+            NotificationType.EMAIL: self._send_email_batch,
+            NotificationType.PUSH: self._send_push_batch,
+            NotificationType.SMS: self._send_sms_batch,
+        }
         self._notifications: dict[str, Notification] = {}
+        self._user_index: defaultdict[str, list[Notification]] = defaultdict(list)
+        self._unread_counts: defaultdict[str, int] = defaultdict(int)
         self._user_preferences: dict[str, dict] = {}
         self._notification_counter = 0
 
@@ -75,6 +130,9 @@ class NotificationService:
         """
         Send a notification to a user.
 
+        The notification is stored immediately and delivered in the
+        background; use wait_for_delivery to block until it is sent.
+
         Args:
             user_id: The ID of the user to notify
             title: The notification title
@@ -95,10 +153,123 @@ class NotificationService:
         )
 
         self._notifications[notification.id] = notification
-        self._deliver_notification(notification)
+        self._user_index[user_id].append(notification)
+        self._unread_counts[user_id] += 1
+
+        self._delivery_slots.acquire()
+        try:
+            future = self._executor.submit(self._deliver_notification, notification)
+        except BaseException:
+            self._delivery_slots.release()
+            raise
+        self._deliveries[notification.id] = future
+        future.add_done_callback(
+            lambda _: self._finish_delivery(notification.id)
+        )
 
         return notification
 
+    def _finish_delivery(self, notification_id: str) -> None:
+        """Forget a finished delivery and free its queue slot."""
+        self._deliveries.pop(notification_id, None)
+        self._delivery_slots.release()
+
+    def wait_for_delivery(
+        self,
+        notification_id: str,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """
+        Wait for a notification's background delivery to finish.
+
+        Args:
+            notification_id: The notification ID
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            True if the notification was sent
+        """
+        future = self._deliveries.get(notification_id)
+        if future is not None:
+            future.result(timeout)
+
+        notification = self._notifications.get(notification_id)
+        return notification is not None and notification.sent_at is not None
+
+    def send_notifications(
+        self,
+        requests: list[NotificationRequest],
+    ) -> list[Notification]:
+        """
+        Send many notifications at once.
+
+        Notifications are grouped by channel and each channel delivers its
+        group in a single batch instead of one call per notification.
+
+        Args:
+            requests: The notifications to create and send
+
+        Returns:
+            The created Notification objects, in request order
+        """
+        now = datetime.utcnow()
+        notifications = []
+        batches: defaultdict[NotificationType, list[Notification]] = defaultdict(list)
+
+        for request in requests:
+            notification = Notification(
+                id=self._generate_id(),
+                user_id=request.user_id,
+                title=request.title,
+                message=request.message,
+                notification_type=request.notification_type,
+                priority=request.priority,
+                created_at=now,
+            )
+            notifications.append(notification)
+            self._user_index[request.user_id].append(notification)
+            self._unread_counts[request.user_id] += 1
+
+            if self._is_enabled(notification):
+                batches[notification.notification_type].append(notification)
+
+        self._notifications.update((n.id, n) for n in notifications)
+
+        delivered = [
+            batch for notification_type, batch in batches.items()
+            if self._deliver_batch(notification_type, batch)
+        ]
+
+        sent_at = datetime.utcnow()
+        for batch in delivered:
+            for notification in batch:
+                notification.sent_at = sent_at
+
+        return notifications
+
+    def _is_enabled(self, notification: Notification) -> bool:
+        """Check the user's preferences for the notification's channel."""
+        prefs = self._user_preferences.get(notification.user_id, {})
+        return prefs.get(_TYPE_PREF_KEY[notification.notification_type], True)
+
+    def _deliver_batch(
+        self,
+        notification_type: NotificationType,
+        notifications: list[Notification],
+    ) -> bool:
+        """
+        Deliver a batch of notifications through one channel.
+
+        Args:
+            notification_type: The channel shared by the batch
+            notifications: The notifications to deliver
+
+        Returns:
+            True if delivery was successful
+        """
+        send_batch = self._batch_senders.get(notification_type)
+        return send_batch(notifications) if send_batch else True
+
     def _deliver_notification(self, notification: Notification) -> bool:
         """
         Deliver a notification through its specified channel.
@@ -110,19 +281,12 @@ class NotificationService:
             True if delivery was successful
         """
         # Check user preferences
-        prefs = self._user_preferences.get(notification.user_id, {})
-        if not prefs.get(f"{notification.notification_type.value}_enabled", True):
+        if not self._is_enabled(notification):
             return False
 
         # Simulate delivery based on type
-        if notification.notification_type == NotificationType.EMAIL:
-            success = self._send_email(notification)
-        elif notification.notification_type == NotificationType.PUSH:
-            success = self._send_push(notification)
-        elif notification.notification_type == NotificationType.SMS:
-            success = self._send_sms(notification)
-        else:
-            success = True  # IN_APP is always available
+        send = self._senders.get(notification.notification_type)
+        success = send(notification) if send else True
 
         if success:
             notification.sent_at = datetime.utcnow()
@@ -147,6 +311,24 @@ class NotificationService:
         print(f"[SMS] To: {notification.user_id} - {notification.title}")
         return True
 
+    def _send_email_batch(self, notifications: list[Notification]) -> bool:
+        """Send a batch of notifications via email in one delivery."""
+        # Bulk email sending (e.g. one SMTP session) would go here
+        print(f"[EMAIL] Batch of {len(notifications)} notifications")
+        return True
+
+    def _send_push_batch(self, notifications: list[Notification]) -> bool:
+        """Send a batch of push notifications in one delivery."""
+        # Bulk push sending (e.g. one provider batch request) would go here
+        print(f"[PUSH] Batch of {len(notifications)} notifications")
+        return True
+
+    def _send_sms_batch(self, notifications: list[Notification]) -> bool:
+        """Send a batch of SMS notifications in one delivery."""
+        # Bulk SMS sending (e.g. the provider's bulk endpoint) would go here
+        print(f"[SMS] Batch of {len(notifications)} notifications")
+        return True
+
     def get_user_notifications(
         self,
         user_id: str,
@@ -160,17 +342,16 @@ class NotificationService:
             unread_only: If True, only return unread notifications
 
         Returns:
-            List of notifications for the user
+            List of notifications for the user, newest first
         """
-        notifications = [
-            n for n in self._notifications.values()
-            if n.user_id == user_id
-        ]
+        # The per-user list is appended in creation order, so reversing it
+        # yields newest first without sorting
+        notifications = reversed(self._user_index.get(user_id, ()))
 
         if unread_only:
-            notifications = [n for n in notifications if n.read_at is None]
+            return [n for n in notifications if n.read_at is None]
 
-        return sorted(notifications, key=lambda n: n.created_at, reverse=True)
+        return list(notifications)
 
     def mark_as_read(self, notification_id: str) -> bool:
         """
@@ -182,10 +363,14 @@ class NotificationService:
         Returns:
             True if the notification was found and marked
         """
-        if notification_id in self._notifications:
-            self._notifications[notification_id].read_at = datetime.utcnow()
-            return True
-        return False
+        notification = self._notifications.get(notification_id)
+        if notification is None:
+            return False
+
+        if notification.read_at is None:
+            self._unread_counts[notification.user_id] -= 1
+        notification.read_at = datetime.utcnow()
+        return True
 
     def set_user_preferences(
         self,
@@ -220,7 +405,16 @@ class NotificationService:
         Returns:
             Number of unread notifications
         """
-        return len(self.get_user_notifications(user_id, unread_only=True))
+        return self._unread_counts.get(user_id, 0)
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Shut down the delivery thread pool.
+
+        Args:
+            wait: If True, block until queued deliveries have finished
+        """
+        self._executor.shutdown(wait=wait)
 
 
 # Singleton instance
@@ -3,11 +3,16 @@ Task Service
 
 Business logic for task management operations.
 """
-from datetime import datetime
-from typing import List, Optional
+from datetime import timedelta
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
 from src.models.task import Task, TaskCreate, TaskUpdate, Priority, TaskStatus
-from src.services.database import get_db
+from src.models.user import User
+from src.services.auth_service import USER_PROJECTION
+from src.services.database import get_db, reserve_id, utc_now
+
+# Number of task IDs reserved from the counter per database round trip
+TASK_ID_BLOCK_SIZE = 100
 
 
 class TaskService:
@@ -29,7 +34,52 @@ class TaskService:
             The task if found, None otherwise.
         """
         db = await get_db()
-        return await db.tasks.find_one({"id": task_id})
+        result = await db.tasks.find_one({"id": task_id})
+        return Task.model_validate(result) if result else None
+
+    async def get_task_with_users(
+        self,
+        task_id: int,
+        user_ids: List[int]
+    ) -> Tuple[Optional[Task], Dict[int, User]]:
+        """
+        Retrieve a task and a set of users in a single round trip.
+
+        Runs one aggregation on the tasks collection that joins the
+        requested users from the users collection with an $in match.
+
+        Args:
+            task_id: The unique identifier of the task.
+            user_ids: The IDs of the users to fetch alongside the task.
+
+        Returns:
+            A (task, users) tuple. The task is None if not found; users
+            maps each found user's ID to the user.
+        """
+        db = await get_db()
+
+        pipeline = [
+            {"$match": {"id": task_id}},
+            {"$limit": 1},
+            {"$lookup": {
+                "from": "users",
+                "pipeline": [
+                    {"$match": {"id": {"$in": list(user_ids)}}},
+                    {"$project": USER_PROJECTION},
+                ],
+                "as": "users",
+            }},
+        ]
+        results = await db.tasks.aggregate(pipeline).to_list(length=1)
+        if not results:
+            return None, {}
+
+        result = results[0]
+        users = {
+            user["id"]: User.model_construct(**user)
+            for user in result.pop("users")
+        }
+        return Task.model_validate(result), users
 
     async def get_user_tasks(
         self,
@@ -53,15 +103,45 @@ class TaskService:
             List of tasks matching the criteria.
         """
         db = await get_db()
+        cursor = self._user_tasks_cursor(db, user_id, status, priority, skip, limit)
+        return await cursor.to_list(length=limit)
+
+    async def iter_user_tasks(
+        self,
+        user_id: int,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[Priority] = None,
+        skip: int = 0,
+        limit: int = 20,
+    ) -> AsyncIterator[dict]:
+        """
+        Iterate over tasks for a specific user as the cursor returns them.
+
+        Takes the same arguments as get_user_tasks, but yields task
+        documents one at a time instead of building a list.
+        """
+        db = await get_db()
+        cursor = self._user_tasks_cursor(db, user_id, status, priority, skip, limit)
+        async for task in cursor:
+            yield task
 
+    def _user_tasks_cursor(
+        self,
+        db,
+        user_id: int,
+        status: Optional[TaskStatus],
+        priority: Optional[Priority],
+        skip: int,
+        limit: int,
+    ):
+        """Build the cursor for a user's tasks with optional filters."""
         query = {"user_id": user_id}
         if status:
             query["status"] = status
         if priority:
             query["priority"] = priority
 
-        cursor = db.tasks.find(query).skip(skip).limit(limit)
-        return await cursor.to_list(length=limit)
+        return db.tasks.find(query).skip(skip).limit(limit)
 
     async def create_task(
         self,
@@ -80,7 +160,7 @@ class TaskService:
         """
         db = await get_db()
 
-        now = datetime.utcnow()
+        now = utc_now()
         task = Task(
             id=await self._get_next_id(db),
             **task_data.model_dump(),
@@ -110,16 +190,52 @@ class TaskService:
         """
         db = await get_db()
 
-        update_data = task_data.model_dump(exclude_unset=True)
-        update_data["updated_at"] = datetime.utcnow()
-
         result = await db.tasks.find_one_and_update(
             {"id": task_id},
-            {"$set": update_data},
+            {"$set": self._update_fields(task_data)},
+            projection={"_id": 0},
             return_document=True
         )
 
-        return Task(**result) if result else None
+        return Task.model_validate(result) if result else None
+
+    async def update_task_fields(
+        self,
+        task_id: int,
+        task_data: TaskUpdate,
+        user_id: Optional[int] = None
+    ) -> bool:
+        """
+        Update an existing task without reading it back.
+
+        For callers that only need to know whether the update applied.
+
+        Args:
+            task_id: The ID of the task to update.
+            task_data: The fields to update.
+            user_id: If given, only update the task if this user owns it.
+
+        Returns:
+            True if the task was found and updated, False otherwise.
+        """
+        db = await get_db()
+
+        query = {"id": task_id}
+        if user_id is not None:
+            query["user_id"] = user_id
+
+        result = await db.tasks.update_one(
+            query,
+            {"$set": self._update_fields(task_data)}
+        )
+
+        return result.matched_count > 0
+
+    def _update_fields(self, task_data: TaskUpdate) -> dict:
+        """Build the $set document for a task update."""
+        update_data = task_data.model_dump(exclude_unset=True)
+        update_data["updated_at"] = utc_now()
+        return update_data
 
     async def delete_task(self, task_id: int) -> bool:
         """
@@ -146,7 +262,7 @@ class TaskService:
         query = {
             "user_id": user_id,
             "status": {"$ne": TaskStatus.COMPLETED},
-            "due_date": {"$lt": datetime.utcnow()}
+            "due_date": {"$lt": utc_now()}
         }
 
         cursor = db.tasks.find(query)
@@ -169,38 +285,49 @@ class TaskService:
             - overdue_count: Number of overdue tasks
         """
         db = await get_db()
-
-        # Get all user tasks
-        tasks = await db.tasks.find({"user_id": user_id}).to_list(length=1000)
-
-        # Calculate statistics
-        by_status = {}
-        by_priority = {}
-        overdue_count = 0
-        now = datetime.utcnow()
-
-        for task in tasks:
-            # Count by status
-            status = task.get("status", "pending")
-            by_status[status] = by_status.get(status, 0) + 1
-
-            # Count by priority
-            priority = task.get("priority", "medium")
-            by_priority[priority] = by_priority.get(priority, 0) + 1
-
-            # Count overdue
-            due_date = task.get("due_date")
-            if due_date and due_date < now and status != TaskStatus.COMPLETED:
-                overdue_count += 1
+        now = utc_now()
+
+        # Count in the database and return only the grouped totals
+        pipeline = [
+            {"$match": {"user_id": user_id}},
+            {"$facet": {
+                "by_status": [
+                    {"$group": {
+                        "_id": {"$ifNull": ["$status", TaskStatus.PENDING]},
+                        "count": {"$sum": 1},
+                    }},
+                ],
+                "by_priority": [
+                    {"$group": {
+                        "_id": {"$ifNull": ["$priority", Priority.MEDIUM]},
+                        "count": {"$sum": 1},
+                    }},
+                ],
+                "overdue": [
+                    {"$match": {
+                        "status": {"$ne": TaskStatus.COMPLETED},
+                        "due_date": {"$lt": now},
+                    }},
+                    {"$count": "count"},
+                ],
+            }},
+        ]
+        results = await db.tasks.aggregate(pipeline).to_list(length=1)
+        facets = results[0]
+
+        by_status = {group["_id"]: group["count"] for group in facets["by_status"]}
+        by_priority = {group["_id"]: group["count"] for group in facets["by_priority"]}
+        overdue_count = facets["overdue"][0]["count"] if facets["overdue"] else 0
+        total = sum(by_status.values())
 
         # Calculate completion rate
         completion_rate = 0.0
-        if tasks:
+        if total:
             completed_count = by_status.get(TaskStatus.COMPLETED, 0)
-            completion_rate = round(completed_count / len(tasks) * 100, 1)
+            completion_rate = round(completed_count / total * 100, 1)
 
         return {
-            "total": len(tasks),
+            "total": total,
             "by_status": by_status,
             "by_priority": by_priority,
             "overdue_count": overdue_count,
@@ -209,13 +336,7 @@ class TaskService:
 
     async def _get_next_id(self, db) -> int:
         """Generate the next auto-increment ID for tasks."""
-        result = await db.counters.find_one_and_update(
-            {"_id": "tasks"},
-            {"$inc": {"seq": 1}},
-            upsert=True,
-            return_document=True
-        )
-        return result["seq"]
+        return await reserve_id(db, "tasks", TASK_ID_BLOCK_SIZE)
 
     async def get_tasks_summary(self, user_id: int) -> dict:
         """
@@ -261,7 +382,7 @@ class TaskService:
             return None
 
         db = await get_db()
-        now = datetime.utcnow()
+        now = utc_now()
 
         new_task = Task(
             id=await self._get_next_id(db),
@@ -301,7 +422,7 @@ class TaskService:
             - skipped_ids: List of task IDs that were skipped (not owned by user)
         """
         db = await get_db()
-        now = datetime.utcnow()
+        now = utc_now()
 
         # Update only tasks owned by the user
         result = await db.tasks.update_many(
@@ -311,7 +432,8 @@ class TaskService:
 
         # Find which tasks were skipped
         updated_tasks = await db.tasks.find(
-            {"id": {"$in": task_ids}, "user_id": user_id}
+            {"id": {"$in": task_ids}, "user_id": user_id},
+            projection={"_id": 0, "id": 1}
         ).to_list(length=len(task_ids))
         updated_ids = {t["id"] for t in updated_tasks}
         skipped_ids = [tid for tid in task_ids if tid not in updated_ids]
@@ -343,10 +465,9 @@ class TaskService:
             - archived_count: Number of tasks archived
             - archived_ids: List of archived task IDs
         """
-        from datetime import timedelta
-
         db = await get_db()
-        cutoff_date = datetime.utcnow() - timedelta(days=older_than_days)
+        now = utc_now()
+        cutoff_date = now - timedelta(days=older_than_days)
 
         # Find completed tasks older than cutoff
         query = {
@@ -363,7 +484,7 @@ class TaskService:
         # Add archive metadata
         archived_ids = []
         for task in tasks_to_archive:
-            task["archived_at"] = datetime.utcnow()
+            task["archived_at"] = now
             archived_ids.append(task["id"])
 
         # Insert into archive collection
@@ -376,3 +497,17 @@ class TaskService:
             "archived_count": len(archived_ids),
             "archived_ids": archived_ids
         }
+
+
+# Singleton instance
+_task_service = TaskService()
+
+
+def get_task_service() -> TaskService:
+    """
+    Dependency returning the shared TaskService.
+
+    TaskService holds no per-request state, so one instance serves all
+    requests.
+    """
+    return _task_service
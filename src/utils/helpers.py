@@ -3,12 +3,26 @@ Helper Utilities
 
 General-purpose helper functions used across the application.
 """
+from bisect import bisect_right
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 import hashlib
 import secrets
 import string
 
+# Format used by format_datetime and parse_datetime
+DEFAULT_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Characters used by generate_random_string
+_ALPHABET = string.ascii_letters + string.digits
+_ALPHABET_CUTOFF = 256 - 256 % len(_ALPHABET)
+
+# Units used by time_ago, as (seconds per unit, name), smallest first
+_TIME_UNITS = [(60, "minute"), (3600, "hour"), (86400, "day"), (604800, "week")]
+_TIME_THRESHOLDS = [seconds for seconds, _ in _TIME_UNITS]
+
 
 def generate_random_string(length: int = 32) -> str:
     """
@@ -20,8 +34,16 @@ def generate_random_string(length: int = 32) -> str:
     Returns:
         A random string of the specified length.
     """
-    alphabet = string.ascii_letters + string.digits
-    return ''.join(secrets.choice(alphabet) for _ in range(length))
+    # Draw random bytes in bulk and keep only those below the largest
+    # multiple of the alphabet size, so the modulo stays unbiased
+    chars = []
+    while len(chars) < length:
+        for byte in secrets.token_bytes((length - len(chars)) * 2):
+            if byte < _ALPHABET_CUTOFF:
+                chars.append(_ALPHABET[byte % len(_ALPHABET)])
+                if len(chars) == length:
+                    break
+    return ''.join(chars)
 
 
 def generate_token() -> str:
@@ -34,20 +56,38 @@ def generate_token() -> str:
     return secrets.token_hex(32)
 
 
-def hash_string(value: str) -> str:
+def hash_string(value: Union[str, bytes]) -> str:
     """
     Create a SHA-256 hash of a string.
 
     Args:
-        value: The string to hash.
+        value: The string or bytes to hash.
 
     Returns:
         The hexadecimal hash digest.
     """
-    return hashlib.sha256(value.encode()).hexdigest()
+    data = value if isinstance(value, (bytes, bytearray)) else value.encode()
+    return hashlib.sha256(data).hexdigest()
+
+
+def fast_hash_string(value: Union[str, bytes]) -> str:
+    """
+    Create a short BLAKE2b hash of a string.
+
+    Faster than hash_string and suited to identity and cache keys. Not a
+    substitute for a password hash; passwords must stay on a slow KDF.
+
+    Args:
+        value: The string or bytes to hash.
+
+    Returns:
+        The 32-character hexadecimal hash digest.
+    """
+    data = value if isinstance(value, (bytes, bytearray)) else value.encode()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
 
 
-def format_datetime(dt: datetime, format_str: str = "%Y-%m-%d %H:%M:%S") -> str:
+def format_datetime(dt: datetime, format_str: str = DEFAULT_DATETIME_FORMAT) -> str:
     """
     Format a datetime object to string.
 
@@ -58,13 +98,20 @@ def format_datetime(dt: datetime, format_str: str = "%Y-%m-%d %H:%M:%S") -> str:
     Returns:
         Formatted datetime string.
     """
+    # isoformat renders the default format without parsing a format string
+    if format_str == DEFAULT_DATETIME_FORMAT and dt.tzinfo is None and dt.year >= 1000:
+        return dt.isoformat(sep=" ", timespec="seconds")
     return dt.strftime(format_str)
 
 
-def parse_datetime(date_string: str, format_str: str = "%Y-%m-%d %H:%M:%S") -> datetime:
+@lru_cache(maxsize=1024)
+def parse_datetime(date_string: str, format_str: str = DEFAULT_DATETIME_FORMAT) -> datetime:
     """
     Parse a datetime string.
 
+    Results are cached, since the same timestamps are often parsed
+    repeatedly.
+
     Args:
         date_string: The string to parse.
         format_str: The expected format.
@@ -85,51 +132,59 @@ def time_ago(dt: datetime) -> str:
     Returns:
         Human-readable string like "2 hours ago".
     """
-    now = datetime.utcnow()
-    diff = now - dt
-
-    seconds = diff.total_seconds()
+    seconds = (datetime.utcnow() - dt).total_seconds()
 
     if seconds < 60:
         return "just now"
-    elif seconds < 3600:
-        minutes = int(seconds / 60)
-        return f"{minutes} minute{'s' if minutes != 1 else ''} ago"
-    elif seconds < 86400:
-        hours = int(seconds / 3600)
-        return f"{hours} hour{'s' if hours != 1 else ''} ago"
-    elif seconds < 604800:
-        days = int(seconds / 86400)
-        return f"{days} day{'s' if days != 1 else ''} ago"
-    else:
-        weeks = int(seconds / 604800)
-        return f"{weeks} week{'s' if weeks != 1 else ''} ago"
+
+    # Pick the largest unit that fits with one binary search
+    divisor, unit = _TIME_UNITS[bisect_right(_TIME_THRESHOLDS, seconds) - 1]
+    count = int(seconds / divisor)
+    return f"{count} {unit}{'s' if count != 1 else ''} ago"
 
 
 def paginate(
-    items: List[Any],
+    items: Iterable[Any],
     page: int = 1,
-    per_page: int = 20
+    per_page: int = 20,
+    total: Optional[int] = None
 ) -> Dict[str, Any]:
     """
     Paginate a list of items.
 
+    Lists are sliced directly. Other iterables are consumed only up to the
+    end of the requested page when their total is given, so skipped items
+    are never materialized. For database cursors, prefer applying
+    .skip() and .limit() to the query and passing the total count.
+
     Args:
-        items: The list to paginate.
+        items: The list or iterable to paginate.
         page: Current page number (1-indexed).
         per_page: Items per page.
+        total: Total number of items. Required to avoid reading a
+            non-list iterable to the end.
 
     Returns:
         Dictionary with pagination metadata and items.
     """
-    total = len(items)
-    total_pages = (total + per_page - 1) // per_page
-
     start = (page - 1) * per_page
     end = start + per_page
 
+    if isinstance(items, list):
+        page_items = items[start:end]
+        if total is None:
+            total = len(items)
+    elif total is not None:
+        page_items = list(islice(items, start, end))
+    else:
+        items = list(items)
+        page_items = items[start:end]
+        total = len(items)
+
+    total_pages = (total + per_page - 1) // per_page
+
     return {
-        "items": items[start:end],
+        "items": page_items,
         "page": page,
         "per_page": per_page,
         "total": total,
@@ -152,11 +207,19 @@ def merge_dicts(base: Dict, updates: Dict) -> Dict:
     """
     result = base.copy()
 
-    for key, value in updates.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = merge_dicts(result[key], value)
-        else:
-            result[key] = value
+    # Walk nested dicts with an explicit stack instead of recursing;
+    # only sub-dicts that are merged into get copied
+    stack = [(result, updates)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            existing = target.get(key)
+            if isinstance(existing, dict) and isinstance(value, dict):
+                merged = existing.copy()
+                target[key] = merged
+                stack.append((merged, value))
+            else:
+                target[key] = value
 
     return result
 
@@ -172,4 +235,28 @@ def chunk_list(items: List[Any], chunk_size: int) -> List[List[Any]]:
     Returns:
         List of chunks.
     """
-    return [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+    return list(iter_chunks(items, chunk_size))
+
+
+def iter_chunks(items: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    """
+    Yield chunks of specified size one at a time.
+
+    Unlike chunk_list, only one chunk is held in memory at once, and any
+    iterable can be chunked.
+
+    Args:
+        items: The list or iterable to split.
+        chunk_size: Maximum items per chunk.
+
+    Yields:
+        Lists of up to chunk_size items.
+    """
+    if isinstance(items, list):
+        for i in range(0, len(items), chunk_size):
+            yield items[i:i + chunk_size]
+        return
+
+    iterator = iter(items)
+    while batch := list(islice(iterator, chunk_size)):
+        yield batch
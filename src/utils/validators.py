@@ -4,9 +4,24 @@ Validation Utilities
 Common validation functions used across the application.
 """
 import re
+import string
 from datetime import datetime, date
 from typing import Optional
 
+# Email address character classes
+_EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + '._%+-')
+_EMAIL_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + '.-')
+_EMAIL_TLD_CHARS = frozenset(string.ascii_letters)
+
+# Precompiled patterns
+_USERNAME_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9_-]*$')
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]')
+
+# Password character classes
+_UPPERCASE = frozenset(string.ascii_uppercase)
+_LOWERCASE = frozenset(string.ascii_lowercase)
+_SPECIAL_CHARS = frozenset('!@#$%^&*(),.?":{}|<>')
+
 
 def validate_email(email: str) -> bool:
     """
@@ -18,8 +33,18 @@ def validate_email(email: str) -> bool:
     Returns:
         True if valid, False otherwise.
     """
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    # local@host.tld, checked part by part with set membership
+    local, at, domain = email.partition('@')
+    if not at or not local or not _EMAIL_LOCAL_CHARS.issuperset(local):
+        return False
+
+    host, dot, tld = domain.rpartition('.')
+    return (
+        bool(host)
+        and len(tld) >= 2
+        and _EMAIL_DOMAIN_CHARS.issuperset(host)
+        and _EMAIL_TLD_CHARS.issuperset(tld)
+    )
 
 
 def validate_password_strength(password: str) -> dict:
@@ -34,19 +59,33 @@ def validate_password_strength(password: str) -> dict:
     """
     errors = []
 
+    # Classify characters in one pass, stopping once every class is seen
+    has_upper = has_lower = has_digit = has_special = False
+    for char in password:
+        if char in _UPPERCASE:
+            has_upper = True
+        elif char in _LOWERCASE:
+            has_lower = True
+        elif char.isdecimal():
+            has_digit = True
+        elif char in _SPECIAL_CHARS:
+            has_special = True
+        if has_upper and has_lower and has_digit and has_special:
+            break
+
     if len(password) < 8:
         errors.append("Password must be at least 8 characters long")
 
-    if not re.search(r'[A-Z]', password):
+    if not has_upper:
         errors.append("Password must contain at least one uppercase letter")
 
-    if not re.search(r'[a-z]', password):
+    if not has_lower:
         errors.append("Password must contain at least one lowercase letter")
 
-    if not re.search(r'\d', password):
+    if not has_digit:
         errors.append("Password must contain at least one digit")
 
-    if not re.search(r'[!@#$%^&*(),.?":{}|<>]', password):
+    if not has_special:
         errors.append("Password must contain at least one special character")
 
     return {
@@ -91,7 +130,7 @@ def validate_username(username: str) -> dict:
     if len(username) > 30:
         errors.append("Username cannot exceed 30 characters")
 
-    if not re.match(r'^[a-zA-Z][a-zA-Z0-9_-]*$', username):
+    if not _USERNAME_RE.match(username):
         errors.append(
             "Username must start with a letter and contain only "
             "letters, numbers, underscores, and hyphens"
@@ -143,6 +182,6 @@ def sanitize_string(value: str) -> str:
     value = value.strip()
 
     # Remove control characters except newlines and tabs
-    value = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]', '', value)
+    value = _CONTROL_CHARS_RE.sub('', value)
 
     return value
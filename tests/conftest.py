@@ -0,0 +1,234 @@
+"""
+Shared test fixtures.
+
+Tests can run in parallel with pytest-xdist (``pytest -n auto``); each
+worker gets its own MongoDB database.
+"""
+import asyncio
+import json
+import os
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+
+# Settings are read on first use, so this must run before the app is imported
+_worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+os.environ["DATABASE_NAME"] = (
+    f"{os.environ.get('DATABASE_NAME', 'taskmanager_test')}_{_worker}"
+)
+
+# Account registered once per session by the shared_user fixture
+SHARED_USER = {
+    "email": "shared@example.com",
+    "username": "shareduser",
+    "password": "SecurePass123!",
+}
+
+# Collections emptied after every test
+TEST_DATA_COLLECTIONS = ("tasks", "tasks_archive", "comments")
+
+# Account inserted directly into the database by the bootstrap_token fixture
+BOOTSTRAP_USER = {
+    "email": "test@example.com",
+    "username": "testuser",
+    "password": "TestPass123!",
+}
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.get_event_loop_policy()
+    return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hashing():
+    """
+    Use minimum-cost bcrypt when PYTEST_FAST_HASH is set.
+
+    Hashes stay real bcrypt, just cheap to compute, so registration and
+    login behave as in production while running much faster.
+    """
+    if not os.environ.get("PYTEST_FAST_HASH"):
+        yield
+        return
+
+    from passlib.context import CryptContext
+
+    from src.services import auth_service
+
+    context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4)
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(auth_service, "_pwd_context", lambda: context)
+        yield
+
+
+@pytest.fixture(scope="session")
+def app():
+    """The FastAPI app mounted by the client fixture."""
+    return _get_app()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client(app, database):
+    """Create a test client shared by the whole session."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(
+        transport=transport,
+        base_url="http://test",
+        trust_env=False,
+        follow_redirects=False,
+    ) as client:
+        yield client
+
+
+def _get_app():
+    """
+    Import the FastAPI app on first use.
+
+    Keeps app startup out of test collection, so ``pytest --collect-only``
+    does not build the app.
+    """
+    from src.main import app
+
+    return app
+
+
+async def _asgi_request(method, url, headers=None, json_body=None):
+    """
+    Call the app directly and return the response status code.
+
+    Builds the ASGI scope by hand and stops reading at the response
+    start message, skipping the HTTP client entirely.
+    """
+    url = httpx.URL(url)
+    body = b"" if json_body is None else json.dumps(json_body).encode()
+    raw_headers = [(b"host", b"test")]
+    if body:
+        raw_headers.append((b"content-type", b"application/json"))
+        raw_headers.append((b"content-length", str(len(body)).encode()))
+    for name, value in (headers or {}).items():
+        raw_headers.append((name.lower().encode(), value.encode()))
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": url.path,
+        "raw_path": url.raw_path.split(b"?")[0],
+        "query_string": url.query,
+        "root_path": "",
+        "headers": raw_headers,
+        "client": ("testclient", 50000),
+        "server": ("test", 80),
+    }
+
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+
+    async def receive():
+        return messages.pop() if messages else {"type": "http.disconnect"}
+
+    status = None
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start" and status is None:
+            status = message["status"]
+
+    await _get_app()(scope, receive, send)
+    return status
+
+
+@pytest.fixture(scope="session")
+def asgi_request(database):
+    """
+    Request helper for tests that only check a status code.
+
+    Called as ``await asgi_request(method, url, headers=..., json_body=...)``.
+    """
+    return _asgi_request
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def database():
+    """
+    Connect to this worker's test database for the session.
+
+    Requested by the API fixtures, so tests that do not touch the app run
+    without a database.
+
+    Leftover documents from an earlier run are cleared first, keeping the
+    indexes, and the database is dropped once the session ends.
+    """
+    from src.services.database import close_db, get_db, init_db
+
+    await init_db()
+    db = await get_db()
+    for name in await db.list_collection_names():
+        await db[name].delete_many({})
+
+    yield db
+
+    await db.client.drop_database(db.name)
+    await close_db()
+
+
+@pytest_asyncio.fixture
+async def clean_tasks(database):
+    """
+    Remove tasks and comments created by a test once it finishes.
+
+    Used by the task tests through ``pytestmark``.
+
+    Users are kept, since session fixtures hold tokens for them.
+    """
+    yield
+    for name in TEST_DATA_COLLECTIONS:
+        await database[name].delete_many({})
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def shared_user(client):
+    """
+    Register one user for the whole session.
+
+    Returns the user's credentials, so tests that only need an existing
+    account skip registering their own.
+    """
+    await client.post("/api/auth/register", json=SHARED_USER)
+    return SHARED_USER
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def bootstrap_token(database):
+    """
+    Create a user and mint its access token without going through the API.
+
+    The password is hashed once and the user is inserted straight into
+    the database, so tests that only need a valid token skip the
+    register/login requests and their password hashing.
+    """
+    from src.models.user import UserInDB
+    from src.services.auth_service import _pwd_context, get_auth_service
+
+    service = get_auth_service()
+    user = UserInDB(
+        id=await service._get_next_id(database),
+        email=BOOTSTRAP_USER["email"],
+        username=BOOTSTRAP_USER["username"],
+        hashed_password=_pwd_context().hash(BOOTSTRAP_USER["password"]),
+        created_at=datetime.now(timezone.utc),
+    )
+    await database.users.insert_one(user.model_dump())
+
+    token = await service.create_access_token(user)
+    return token.access_token
@@ -0,0 +1,23 @@
+"""
+Tests for the shared test application setup.
+"""
+import sys
+
+import pytest
+
+
+class TestAppImport:
+    """Test cases for the conftest app and client fixtures."""
+
+    @pytest.mark.asyncio
+    async def test_app_imported_once(self, app, client):
+        """Test that the app module is loaded once and served by the client."""
+        main = sys.modules["src.main"]
+
+        # A second copy would show up under another name for the same file
+        loaded_as = [
+            name for name, module in list(sys.modules.items())
+            if getattr(module, "__file__", None) == main.__file__
+        ]
+        assert loaded_as == ["src.main"]
+        assert app is main.app
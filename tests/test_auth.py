@@ -1,17 +1,32 @@
 """
 Tests for Authentication API endpoints.
 """
+import httpx
 import pytest
-from httpx import AsyncClient
+import pytest_asyncio
 
-from src.main import app
+# Parsed once and reused by every request to them
+AUTH_URL = httpx.URL("http://test/api/auth/")
+REGISTER_URL = AUTH_URL.join("register")
+LOGIN_URL = AUTH_URL.join("login")
+REFRESH_URL = AUTH_URL.join("refresh")
+ME_URL = AUTH_URL.join("me")
 
+# Registration fields shared by every test user
+BASE_REG = {"password": "SecurePass123!"}
 
-@pytest.fixture
-async def client():
-    """Create test client."""
-    async with AsyncClient(app=app, base_url="http://test") as client:
-        yield client
+# Fields every login response must include
+REQUIRED_LOGIN_KEYS = frozenset({"access_token", "token_type", "expires_in"})
+
+
+@pytest_asyncio.fixture(scope="class", loop_scope="session")
+async def access_token(client, shared_user):
+    """Log the shared user in through the API once per test class."""
+    response = await client.post(LOGIN_URL, json={
+        "email": shared_user["email"],
+        "password": shared_user["password"],
+    })
+    return response.json()["access_token"]
 
 
 class TestAuthEndpoints:
@@ -20,10 +35,9 @@ class TestAuthEndpoints:
     @pytest.mark.asyncio
     async def test_register_user(self, client):
         """Test user registration."""
-        response = await client.post("/api/auth/register", json={
+        response = await client.post(REGISTER_URL, json=BASE_REG | {
             "email": "newuser@example.com",
             "username": "newuser",
-            "password": "SecurePass123!",
             "full_name": "New User",
         })
 
@@ -35,158 +49,135 @@ class TestAuthEndpoints:
         assert "hashed_password" not in data
 
     @pytest.mark.asyncio
-    async def test_register_duplicate_email(self, client):
-        """Test registration with existing email fails."""
+    @pytest.mark.parametrize("dup_field,expected", [
+        ("email", "already registered"),
+        ("username", "already taken"),
+    ])
+    async def test_register_duplicate(self, client, dup_field, expected):
+        """Test registration with an existing email or username fails."""
         # Register first user
-        await client.post("/api/auth/register", json={
-            "email": "duplicate@example.com",
-            "username": "user1",
-            "password": "SecurePass123!",
-        })
-
-        # Try to register with same email
-        response = await client.post("/api/auth/register", json={
-            "email": "duplicate@example.com",
-            "username": "user2",
-            "password": "SecurePass123!",
+        first = BASE_REG | {
+            "email": f"first_{dup_field}@example.com",
+            "username": f"first_{dup_field}",
+        }
+        await client.post(REGISTER_URL, json=first)
+
+        # Try to register again, reusing only the duplicated field
+        response = await client.post(REGISTER_URL, json=BASE_REG | {
+            "email": f"second_{dup_field}@example.com",
+            "username": f"second_{dup_field}",
+            dup_field: first[dup_field],
         })
 
         assert response.status_code == 400
-        assert "already registered" in response.json()["detail"]
+        assert expected in response.json()["detail"]
 
     @pytest.mark.asyncio
-    async def test_register_duplicate_username(self, client):
-        """Test registration with existing username fails."""
-        # Register first user
-        await client.post("/api/auth/register", json={
-            "email": "user1@example.com",
-            "username": "sameusername",
-            "password": "SecurePass123!",
-        })
-
-        # Try to register with same username
-        response = await client.post("/api/auth/register", json={
-            "email": "user2@example.com",
-            "username": "sameusername",
-            "password": "SecurePass123!",
+    async def test_register_duplicate_across_users(self, client):
+        """Test that a taken email is reported when another user has the username."""
+        owner_a = BASE_REG | {"email": "owner_a@example.com", "username": "owner_a"}
+        owner_b = BASE_REG | {"email": "owner_b@example.com", "username": "owner_b"}
+        for user in (owner_a, owner_b):
+            await client.post(REGISTER_URL, json=user)
+
+        # A's username with B's email
+        response = await client.post(REGISTER_URL, json=BASE_REG | {
+            "email": owner_b["email"],
+            "username": owner_a["username"],
         })
 
         assert response.status_code == 400
-        assert "already taken" in response.json()["detail"]
+        assert "already registered" in response.json()["detail"]
 
     @pytest.mark.asyncio
-    async def test_login_success(self, client):
+    async def test_login_success(self, client, shared_user):
         """Test successful login."""
-        # Register user
-        await client.post("/api/auth/register", json={
-            "email": "login@example.com",
-            "username": "loginuser",
-            "password": "SecurePass123!",
-        })
-
-        # Login
-        response = await client.post("/api/auth/login", json={
-            "email": "login@example.com",
-            "password": "SecurePass123!",
+        response = await client.post(LOGIN_URL, json={
+            "email": shared_user["email"],
+            "password": shared_user["password"],
         })
 
         assert response.status_code == 200
         data = response.json()
-        assert "access_token" in data
+        assert REQUIRED_LOGIN_KEYS <= data.keys()
         assert data["token_type"] == "bearer"
-        assert "expires_in" in data
 
     @pytest.mark.asyncio
-    async def test_login_wrong_password(self, client):
+    async def test_login_wrong_password(self, client, shared_user):
         """Test login with wrong password fails."""
-        # Register user
-        await client.post("/api/auth/register", json={
-            "email": "wrongpass@example.com",
-            "username": "wrongpassuser",
-            "password": "SecurePass123!",
-        })
-
-        # Login with wrong password
-        response = await client.post("/api/auth/login", json={
-            "email": "wrongpass@example.com",
+        response = await client.post(LOGIN_URL, json={
+            "email": shared_user["email"],
             "password": "WrongPassword!",
         })
 
         assert response.status_code == 401
 
     @pytest.mark.asyncio
-    async def test_login_nonexistent_user(self, client):
+    async def test_login_nonexistent_user(self, asgi_request):
         """Test login with non-existent user fails."""
-        response = await client.post("/api/auth/login", json={
+        status = await asgi_request("POST", LOGIN_URL, json_body={
             "email": "nobody@example.com",
             "password": "SomePassword123!",
         })
 
-        assert response.status_code == 401
+        assert status == 401
 
     @pytest.mark.asyncio
-    async def test_get_current_user(self, client):
+    async def test_get_current_user(self, client, shared_user, access_token):
         """Test getting current user info."""
-        # Register and login
-        await client.post("/api/auth/register", json={
-            "email": "me@example.com",
-            "username": "meuser",
-            "password": "SecurePass123!",
-        })
-
-        login_response = await client.post("/api/auth/login", json={
-            "email": "me@example.com",
-            "password": "SecurePass123!",
-        })
-
-        token = login_response.json()["access_token"]
-
-        # Get current user
         response = await client.get(
-            "/api/auth/me",
-            headers={"Authorization": f"Bearer {token}"}
+            ME_URL,
+            headers={"Authorization": f"Bearer {access_token}"}
         )
 
         assert response.status_code == 200
         data = response.json()
-        assert data["email"] == "me@example.com"
-        assert data["username"] == "meuser"
+        assert data["email"] == shared_user["email"]
+        assert data["username"] == shared_user["username"]
 
     @pytest.mark.asyncio
-    async def test_refresh_token(self, client):
-        """Test token refresh."""
-        # Register and login
-        await client.post("/api/auth/register", json={
-            "email": "refresh@example.com",
-            "username": "refreshuser",
-            "password": "SecurePass123!",
+    async def test_created_at_round_trip(self, client):
+        """Test that registration and /me report the same creation time."""
+        user = BASE_REG | {
+            "email": "roundtrip@example.com",
+            "username": "roundtrip",
+        }
+        registered = await client.post(REGISTER_URL, json=user)
+        login = await client.post(LOGIN_URL, json={
+            "email": user["email"],
+            "password": user["password"],
         })
 
-        login_response = await client.post("/api/auth/login", json={
-            "email": "refresh@example.com",
-            "password": "SecurePass123!",
-        })
+        response = await client.get(
+            ME_URL,
+            headers={"Authorization": f"Bearer {login.json()['access_token']}"}
+        )
 
-        token = login_response.json()["access_token"]
+        assert response.status_code == 200
+        assert response.json()["created_at"] == registered.json()["created_at"]
 
+    @pytest.mark.asyncio
+    async def test_refresh_token(self, client, access_token):
+        """Test token refresh."""
         # Refresh token
         response = await client.post(
-            "/api/auth/refresh",
-            headers={"Authorization": f"Bearer {token}"}
+            REFRESH_URL,
+            headers={"Authorization": f"Bearer {access_token}"}
         )
 
         assert response.status_code == 200
         data = response.json()
         assert "access_token" in data
         # New token should be different
-        assert data["access_token"] != token
+        assert data["access_token"] != access_token
 
     @pytest.mark.asyncio
-    async def test_invalid_token(self, client):
+    async def test_invalid_token(self, asgi_request):
         """Test that invalid tokens are rejected."""
-        response = await client.get(
-            "/api/auth/me",
+        status = await asgi_request(
+            "GET",
+            ME_URL,
             headers={"Authorization": "Bearer invalid-token"}
         )
 
-        assert response.status_code == 401
+        assert status == 401
@@ -0,0 +1,174 @@
+"""
+Tests for the Notification Service.
+"""
+import threading
+
+import pytest
+
+from src.services.notification_service import (
+    DELIVERY_QUEUE_FACTOR,
+    NotificationRequest,
+    NotificationService,
+    NotificationType,
+)
+
+# Upper bound for any wait on a background delivery
+TIMEOUT = 5
+
+
+class GatedNotificationService(NotificationService):
+    """Notification service whose email deliveries wait for a gate."""
+
+    def __init__(self, max_workers: int = 1):
+        self.gate = threading.Event()
+        super().__init__(max_workers=max_workers)
+
+    def _send_email(self, notification):
+        return self.gate.wait(TIMEOUT)
+
+
+class RecordingNotificationService(NotificationService):
+    """Notification service that records each email and push batch."""
+
+    def __init__(self):
+        self.batches = []
+        super().__init__(max_workers=1)
+
+    def _send_email_batch(self, notifications):
+        self.batches.append((NotificationType.EMAIL, [n.title for n in notifications]))
+        return True
+
+    def _send_push_batch(self, notifications):
+        self.batches.append((NotificationType.PUSH, [n.title for n in notifications]))
+        return True
+
+
+@pytest.fixture
+def service():
+    """Create a gated service and shut it down after the test."""
+    service = GatedNotificationService()
+    yield service
+    service.gate.set()
+    service.close()
+
+
+class TestBackgroundDelivery:
+    """Test cases for single notification delivery."""
+
+    def test_send_returns_before_delivery(self, service):
+        """Test that sending does not wait for the channel."""
+        notification = service.send_notification(
+            "user1", "Title", "Body", NotificationType.EMAIL
+        )
+
+        assert notification.sent_at is None
+        assert service.get_unread_count("user1") == 1
+
+        service.gate.set()
+        assert service.wait_for_delivery(notification.id, TIMEOUT)
+        assert notification.sent_at is not None
+
+    def test_disabled_channel_is_not_sent(self, service):
+        """Test that a disabled channel skips delivery."""
+        service.set_user_preferences("user1", email_enabled=False)
+        notification = service.send_notification(
+            "user1", "Title", "Body", NotificationType.EMAIL
+        )
+
+        assert not service.wait_for_delivery(notification.id, TIMEOUT)
+        assert notification.sent_at is None
+
+    def test_queue_is_bounded(self, service):
+        """Test that sending blocks once the delivery queue is full."""
+        # One delivery running plus the queued ones fill every slot
+        for i in range(DELIVERY_QUEUE_FACTOR):
+            service.send_notification(
+                "user1", f"Queued {i}", "Body", NotificationType.EMAIL
+            )
+
+        overflow = threading.Thread(
+            target=service.send_notification,
+            args=("user1", "Overflow", "Body", NotificationType.EMAIL),
+        )
+        overflow.start()
+        overflow.join(0.2)
+        assert overflow.is_alive()
+
+        service.gate.set()
+        overflow.join(TIMEOUT)
+        assert not overflow.is_alive()
+
+    def test_close_waits_for_queued_deliveries(self, service):
+        """Test that close finishes deliveries already queued."""
+        notification = service.send_notification(
+            "user1", "Title", "Body", NotificationType.EMAIL
+        )
+
+        service.gate.set()
+        service.close()
+
+        assert notification.sent_at is not None
+
+
+@pytest.fixture
+def bulk_service():
+    """Create a recording service and shut it down after the test."""
+    service = RecordingNotificationService()
+    yield service
+    service.close()
+
+
+class TestBulkDelivery:
+    """Test cases for sending many notifications at once."""
+
+    def test_batches_per_channel(self, bulk_service):
+        """Test that each channel receives its notifications in one batch."""
+        notifications = bulk_service.send_notifications([
+            NotificationRequest("user1", "Email 1", "Body", NotificationType.EMAIL),
+            NotificationRequest("user2", "Push 1", "Body", NotificationType.PUSH),
+            NotificationRequest("user2", "Email 2", "Body", NotificationType.EMAIL),
+        ])
+
+        assert [n.title for n in notifications] == ["Email 1", "Push 1", "Email 2"]
+        assert bulk_service.batches == [
+            (NotificationType.EMAIL, ["Email 1", "Email 2"]),
+            (NotificationType.PUSH, ["Push 1"]),
+        ]
+        assert all(n.sent_at is not None for n in notifications)
+        assert len({n.created_at for n in notifications}) == 1
+
+    def test_disabled_channel_is_suppressed(self, bulk_service):
+        """Test that a disabled channel is left out of its batch."""
+        bulk_service.set_user_preferences("user1", email_enabled=False)
+
+        suppressed, sent, in_app = bulk_service.send_notifications([
+            NotificationRequest("user1", "Email off", "Body", NotificationType.EMAIL),
+            NotificationRequest("user2", "Email on", "Body", NotificationType.EMAIL),
+            NotificationRequest("user1", "In app", "Body", NotificationType.IN_APP),
+        ])
+
+        assert bulk_service.batches == [(NotificationType.EMAIL, ["Email on"])]
+        assert suppressed.sent_at is None
+        assert sent.sent_at is not None
+        assert in_app.sent_at is not None
+
+    def test_unread_counts_and_order(self, bulk_service):
+        """Test unread counts and newest-first listing after a bulk send."""
+        bulk_service.send_notification("user1", "Single", "Body")
+        bulk_service.send_notifications([
+            NotificationRequest("user1", "Bulk 1", "Body"),
+            NotificationRequest("user2", "Other", "Body"),
+            NotificationRequest("user1", "Bulk 2", "Body"),
+        ])
+
+        assert bulk_service.get_unread_count("user1") == 3
+        assert bulk_service.get_unread_count("user2") == 1
+
+        titles = [n.title for n in bulk_service.get_user_notifications("user1")]
+        assert titles == ["Bulk 2", "Bulk 1", "Single"]
+
+        newest = bulk_service.get_user_notifications("user1")[0]
+        assert bulk_service.mark_as_read(newest.id)
+        assert bulk_service.get_unread_count("user1") == 2
+        unread = bulk_service.get_user_notifications("user1", unread_only=True)
+        assert [n.title for n in unread] == ["Bulk 1", "Single"]
@@ -1,39 +1,36 @@
 """
 Tests for Task API endpoints.
 """
+import asyncio
+
+import httpx
 import pytest
-from httpx import AsyncClient
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
-from src.main import app
 from src.models.task import Priority, TaskStatus
 
+# Parsed once; task URLs are joined onto this
+TASKS_URL = httpx.URL("http://test/api/tasks/")
 
-@pytest.fixture
-async def client():
-    """Create test client."""
-    async with AsyncClient(app=app, base_url="http://test") as client:
-        yield client
+# Due date a week out, fixed for the whole run
+DUE_DATE = (datetime.now(timezone.utc) + timedelta(days=7)).isoformat()
+
+# Start every test without tasks left over from earlier ones
+pytestmark = pytest.mark.usefixtures("clean_tasks")
 
 
 @pytest.fixture
-async def auth_headers(client):
+async def auth_headers(bootstrap_token):
     """Get authentication headers for test user."""
-    # Register test user
-    await client.post("/api/auth/register", json={
-        "email": "test@example.com",
-        "username": "testuser",
-        "password": "TestPass123!",
-    })
+    return {"Authorization": f"Bearer {bootstrap_token}"}
 
-    # Login
-    response = await client.post("/api/auth/login", json={
-        "email": "test@example.com",
-        "password": "TestPass123!",
-    })
 
-    token = response.json()["access_token"]
-    return {"Authorization": f"Bearer {token}"}
+async def create_tasks(client, headers, titles):
+    """Create tasks with the given titles concurrently."""
+    return await asyncio.gather(*(
+        client.post(TASKS_URL, headers=headers, json={"title": title})
+        for title in titles
+    ))
 
 
 class TestTaskEndpoints:
@@ -43,7 +40,7 @@ class TestTaskEndpoints:
     async def test_create_task(self, client, auth_headers):
         """Test creating a new task."""
         response = await client.post(
-            "/api/tasks/",
+            TASKS_URL,
             headers=auth_headers,
             json={
                 "title": "Test Task",
@@ -61,14 +58,12 @@ class TestTaskEndpoints:
     @pytest.mark.asyncio
     async def test_create_task_with_due_date(self, client, auth_headers):
         """Test creating a task with a due date."""
-        due_date = (datetime.utcnow() + timedelta(days=7)).isoformat()
-
         response = await client.post(
-            "/api/tasks/",
+            TASKS_URL,
             headers=auth_headers,
             json={
                 "title": "Task with deadline",
-                "due_date": due_date,
+                "due_date": DUE_DATE,
             }
         )
 
@@ -79,30 +74,26 @@ class TestTaskEndpoints:
     async def test_list_tasks(self, client, auth_headers):
         """Test listing user tasks."""
         # Create some tasks first
-        for i in range(3):
-            await client.post(
-                "/api/tasks/",
-                headers=auth_headers,
-                json={"title": f"Task {i}"}
-            )
+        await create_tasks(client, auth_headers, [f"Task {i}" for i in range(3)])
 
-        response = await client.get("/api/tasks/", headers=auth_headers)
+        response = await client.get(TASKS_URL, headers=auth_headers)
 
         assert response.status_code == 200
         data = response.json()
-        assert len(data) >= 3
+        assert len(data) == 3
 
     @pytest.mark.asyncio
     async def test_list_tasks_with_filter(self, client, auth_headers):
         """Test filtering tasks by status."""
         response = await client.get(
-            "/api/tasks/",
+            TASKS_URL,
             headers=auth_headers,
             params={"status": "pending"}
         )
 
         assert response.status_code == 200
-        for task in response.json():
+        data = response.json()
+        for task in data:
             assert task["status"] == "pending"
 
     @pytest.mark.asyncio
@@ -110,7 +101,7 @@ class TestTaskEndpoints:
         """Test getting a single task."""
         # Create task
         create_response = await client.post(
-            "/api/tasks/",
+            TASKS_URL,
             headers=auth_headers,
             json={"title": "Get me"}
         )
@@ -118,7 +109,7 @@ class TestTaskEndpoints:
 
         # Get task
         response = await client.get(
-            f"/api/tasks/{task_id}",
+            TASKS_URL.join(str(task_id)),
             headers=auth_headers
         )
 
@@ -126,21 +117,22 @@ class TestTaskEndpoints:
         assert response.json()["title"] == "Get me"
 
     @pytest.mark.asyncio
-    async def test_get_nonexistent_task(self, client, auth_headers):
+    async def test_get_nonexistent_task(self, asgi_request, auth_headers):
         """Test getting a task that doesn't exist."""
-        response = await client.get(
-            "/api/tasks/99999",
+        status = await asgi_request(
+            "GET",
+            TASKS_URL.join("99999"),
             headers=auth_headers
         )
 
-        assert response.status_code == 404
+        assert status == 404
 
     @pytest.mark.asyncio
     async def test_update_task(self, client, auth_headers):
         """Test updating a task."""
         # Create task
         create_response = await client.post(
-            "/api/tasks/",
+            TASKS_URL,
             headers=auth_headers,
             json={"title": "Original"}
         )
@@ -148,7 +140,7 @@ class TestTaskEndpoints:
 
         # Update task
         response = await client.put(
-            f"/api/tasks/{task_id}",
+            TASKS_URL.join(str(task_id)),
             headers=auth_headers,
             json={"title": "Updated", "priority": "urgent"}
         )
@@ -158,12 +150,53 @@ class TestTaskEndpoints:
         assert data["title"] == "Updated"
         assert data["priority"] == "urgent"
 
+    @pytest.mark.asyncio
+    async def test_patch_task(self, client, auth_headers):
+        """Test updating task fields without reading the task back."""
+        # Create task
+        create_response = await client.post(
+            TASKS_URL,
+            headers=auth_headers,
+            json={"title": "Original"}
+        )
+        task_id = create_response.json()["id"]
+
+        # Patch task
+        response = await client.patch(
+            TASKS_URL.join(str(task_id)),
+            headers=auth_headers,
+            json={"status": "in_progress"}
+        )
+
+        assert response.status_code == 204
+
+        # Verify updated
+        get_response = await client.get(
+            TASKS_URL.join(str(task_id)),
+            headers=auth_headers
+        )
+        data = get_response.json()
+        assert data["status"] == "in_progress"
+        assert data["title"] == "Original"
+
+    @pytest.mark.asyncio
+    async def test_patch_nonexistent_task(self, asgi_request, auth_headers):
+        """Test patching a task that doesn't exist."""
+        status = await asgi_request(
+            "PATCH",
+            TASKS_URL.join("99999"),
+            headers=auth_headers,
+            json_body={"title": "Missing"}
+        )
+
+        assert status == 404
+
     @pytest.mark.asyncio
     async def test_delete_task(self, client, auth_headers):
         """Test deleting a task."""
         # Create task
         create_response = await client.post(
-            "/api/tasks/",
+            TASKS_URL,
             headers=auth_headers,
             json={"title": "Delete me"}
         )
@@ -171,7 +204,7 @@ class TestTaskEndpoints:
 
         # Delete task
         response = await client.delete(
-            f"/api/tasks/{task_id}",
+            TASKS_URL.join(str(task_id)),
             headers=auth_headers
         )
 
@@ -179,7 +212,7 @@ class TestTaskEndpoints:
 
         # Verify deleted
         get_response = await client.get(
-            f"/api/tasks/{task_id}",
+            TASKS_URL.join(str(task_id)),
             headers=auth_headers
         )
         assert get_response.status_code == 404
@@ -189,7 +222,7 @@ class TestTaskEndpoints:
         """Test marking a task as complete."""
         # Create task
         create_response = await client.post(
-            "/api/tasks/",
+            TASKS_URL,
             headers=auth_headers,
             json={"title": "Complete me"}
         )
@@ -197,7 +230,7 @@ class TestTaskEndpoints:
 
         # Complete task
         response = await client.post(
-            f"/api/tasks/{task_id}/complete",
+            TASKS_URL.join(f"{task_id}/complete"),
             headers=auth_headers
         )
 
@@ -205,7 +238,7 @@ class TestTaskEndpoints:
         assert response.json()["status"] == "completed"
 
     @pytest.mark.asyncio
-    async def test_unauthorized_access(self, client):
+    async def test_unauthorized_access(self, asgi_request):
         """Test that unauthenticated requests are rejected."""
-        response = await client.get("/api/tasks/")
-        assert response.status_code == 401
+        status = await asgi_request("GET", TASKS_URL)
+        assert status == 401
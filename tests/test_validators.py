@@ -0,0 +1,45 @@
+"""
+Tests for validation utilities.
+"""
+import pytest
+
+from src.utils.validators import validate_email
+
+
+class TestValidateEmail:
+    """Test cases for email address validation."""
+
+    @pytest.mark.parametrize("email", [
+        "user@example.com",
+        "first.last@example.com",
+        "user+tag@sub.example.co",
+        "a_b%c-d@my-host.example.org",
+        "u@x.io",
+        "user@example.COM",
+    ])
+    def test_valid(self, email):
+        """Test that well-formed addresses are accepted."""
+        assert validate_email(email)
+
+    @pytest.mark.parametrize("email", [
+        "",
+        "plainaddress",
+        "@example.com",
+        "user@",
+        "user@@example.com",
+        "user@host@example.com",
+        "user@example",
+        "user@.com",
+        "user@example.c",
+        "user@example.c0m",
+        "user@example.123",
+        "user@example.",
+        "user name@example.com",
+        "usér@example.com",
+        "user@exa_mple.com",
+        "user@example.com\n",
+        " user@example.com",
+    ])
+    def test_invalid(self, email):
+        """Test that malformed addresses are rejected."""
+        assert not validate_email(email)